@@ -0,0 +1,44 @@
+"""
+JSON Serialization Helpers
+
+Uses orjson when installed (an optional speedup), falling back to the
+stdlib json module. Output is the same either way: compact UTF-8 bytes
+from dumps(), two-space indented text from dumps_pretty().
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def dumps_pretty(data: Any) -> str:
+    """Serialize to indented JSON text for logging."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-str keys; let stdlib json handle (or report) it
+    return json.dumps(data, indent=2)
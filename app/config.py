@@ -8,11 +8,33 @@ Contains:
 - Logging configuration
 """
 
+import functools
+import logging
 import os
-from dotenv import load_dotenv
+import types
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_Number = TypeVar("_Number", int, float)
+
+
+# ============================================================================
+# Environment
+# ============================================================================
+
+@functools.cache
+def load_env() -> bool:
+    """
+    Load environment variables from .env (once, on first use).
+    
+    Deferred so entry points that never talk to the LLM skip dotenv entirely.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
 
-# Load environment variables
-load_dotenv()
 
 # ============================================================================
 # Local LLM Configuration (Ollama)
@@ -22,96 +44,140 @@ OLLAMA_BASE_URL = "http://localhost:11434/v1"  # Ollama's OpenAI-compatible endp
 OLLAMA_MODEL = "llama3:latest"  # Local model
 LLM_TEMPERATURE = 0.0  # Deterministic output
 LLM_MAX_RETRIES = 3  # Max retries for invalid JSON
+LLM_MAX_TOKENS = 512  # Generation budget per command (a command is ~150 tokens)
+
+
+# ============================================================================
+# Runtime Settings (process environment or .env)
+# ============================================================================
+
+@dataclass(frozen=True)
+class Settings:
+    """Tunables that may be overridden from the environment."""
+    intent_cache_size: int  # Compiled commands kept in memory (0 disables)
+    fast_path_enabled: bool  # Resolve known phrases without the LLM
+    # Semantic cache: reuse commands of similarly worded inputs (empty model disables)
+    semantic_cache_model: str  # Ollama embedding model, e.g. "all-minilm"
+    semantic_cache_threshold: float  # Min cosine similarity
+    semantic_cache_size: int  # Utterances kept in memory
+
+
+def _env_number(name: str, default: str, parse: Callable[[str], _Number]) -> _Number:
+    """Parse a numeric setting, falling back to its default if malformed."""
+    raw = os.environ.get(name, default)
+    try:
+        return parse(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using default %s", name, raw, default)
+        return parse(default)
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """
+    Read the runtime settings (once, on first use).
+    
+    Read after load_env() so values set in .env apply too.
+    """
+    load_env()
+    env = os.environ.get
+    return Settings(
+        intent_cache_size=_env_number("INTENT_CACHE_SIZE", "4096", int),
+        fast_path_enabled=env("FAST_PATH_ENABLED", "1") == "1",
+        semantic_cache_model=env("SEMANTIC_CACHE_MODEL", ""),
+        semantic_cache_threshold=_env_number("SEMANTIC_CACHE_THRESHOLD", "0.88", float),
+        semantic_cache_size=_env_number("SEMANTIC_CACHE_SIZE", "512", int),
+    )
 
 
 # ============================================================================
 # System Prompt for Intent Compiler (LLM #1)
 # ============================================================================
 
-INTENT_COMPILER_SYSTEM_PROMPT = """You are an intent-to-JSON compiler for a game AI companion.
-
-Your job:
-- Classify the player's intent into ONE supported action type
-- Output ONLY valid JSON
-- Follow the schema exactly
-- Do NOT explain, check feasibility, or access game state
-
-SUPPORTED ACTIONS (closed vocabulary):
-- move_to           → Move to target (Params: movement_speed, formation, stance)
-- follow            → Follow leader (Params: distance, formation)
-- hold_position     → Stay (Params: stance, face_direction, duration)
-- take_cover        → Move to cover (Params: stance, face_direction)
-- engage            → Attack target (Params: engagement_style, fire_mode)
-- suppress          → Suppressive fire (Params: duration, fire_mode, ammo_conservation)
-- overwatch         → Watch area (Params: engagement_rules, report_events)
-- clear_area        → Clear room (Params: engagement_rules, formation)
-- pick_up           → Pick up loot (Target descriptors identify item)
-- interact          → Use object (Params: interaction [open/close/activate])
-- use_item_on       → Use item on target (Params: item_type)
-- throw_equipment   → Throw grenade/utility (Params: equipment_type)
-- retreat           → Fall back (Params: retreat_direction, movement_speed)
-- regroup           → Return to squad (Params: formation)
-- cancel            → Cancel current task
-
-COMMON PARAMETERS:
-- spatial_direction: "Front", "Left", "Right", "Back" (REQUIRED if direction is mentioned)
-- priority: "low", "normal", "high", "critical"
-
-COMMAND STRUCTURE:
-{
-  "command_id": "cmd_001",
-  "actions": [{
-    "action_id": "act_001",
-    "type": "move_to",
-    "target": {"descriptors": ["left"], "category_hint": "location"},
-    "parameters": {
-        "spatial_direction": "Left" 
-    },
-    "assigned_to": "companion_01",
-    "priority": "normal",
-    "depends_on": null
-  }],
-  "dialogue_context": "move left",
-  "requires_clarification": false
-}
-"""
+_PROMPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+
+@functools.cache
+def get_intent_prompt() -> str:
+    """Return the Intent Compiler system prompt (read from prompts/ on first use)."""
+    with open(os.path.join(_PROMPT_DIR, "intent_compiler_system.txt"), encoding="utf-8") as f:
+        return f.read()
+
+
+# ============================================================================
+# Response IDs (emitted by Mock Unreal Engine, keys of DIALOGUE_MAP)
+# ============================================================================
+
+# Movement
+RESP_FOLLOW_ACCEPT = "RESP_FOLLOW_ACCEPT"
+RESP_ALREADY_FOLLOWING = "RESP_ALREADY_FOLLOWING"
+RESP_STOP_ACCEPT = "RESP_STOP_ACCEPT"
+RESP_NOT_FOLLOWING = "RESP_NOT_FOLLOWING"
+RESP_MOVE_ACCEPT = "RESP_MOVE_ACCEPT"
+RESP_HOLD_ACCEPT = "RESP_HOLD_ACCEPT"
+RESP_RETREAT_ACCEPT = "RESP_RETREAT_ACCEPT"
+RESP_REGROUP_ACCEPT = "RESP_REGROUP_ACCEPT"
+
+# Combat
+RESP_ENGAGE_ACCEPT = "RESP_ENGAGE_ACCEPT"
+RESP_NO_TARGET = "RESP_NO_TARGET"
+RESP_SUPPRESS_ACCEPT = "RESP_SUPPRESS_ACCEPT"
+RESP_OVERWATCH_ACCEPT = "RESP_OVERWATCH_ACCEPT"
+RESP_COVER_ACCEPT = "RESP_COVER_ACCEPT"
+RESP_CLEAR_ACCEPT = "RESP_CLEAR_ACCEPT"
+RESP_DEFEND_ACCEPT = "RESP_DEFEND_ACCEPT"
+
+# Interaction
+RESP_PICKUP_ACCEPT = "RESP_PICKUP_ACCEPT"
+RESP_INTERACT_ACCEPT = "RESP_INTERACT_ACCEPT"
+RESP_USE_ITEM_ACCEPT = "RESP_USE_ITEM_ACCEPT"
+RESP_THROW_ACCEPT = "RESP_THROW_ACCEPT"
+
+# General
+RESP_ASSIST_ACCEPT = "RESP_ASSIST_ACCEPT"
+RESP_CANCEL_ACCEPT = "RESP_CANCEL_ACCEPT"
+RESP_UNKNOWN_COMMAND = "RESP_UNKNOWN_COMMAND"
+RESP_UNSUPPORTED_ACTION = "RESP_UNSUPPORTED_ACTION"
 
 
 # ============================================================================
 # Response ID to Dialogue Mapping
 # ============================================================================
 
-DIALOGUE_MAP = {
+_DIALOGUE_MAP = {
     # Movement
-    "RESP_FOLLOW_ACCEPT": "Right behind you.",
-    "RESP_ALREADY_FOLLOWING": "Roger that. Following.",
-    "RESP_STOP_ACCEPT": "Stopping here.",
-    "RESP_NOT_FOLLOWING": "I'm not moving.",
-    "RESP_MOVE_ACCEPT": "Moving to position.",
-    "RESP_HOLD_ACCEPT": "Holding position.",
-    "RESP_RETREAT_ACCEPT": "Falling back!",
-    "RESP_REGROUP_ACCEPT": "On me, regroup!",
+    RESP_FOLLOW_ACCEPT: "Right behind you.",
+    RESP_ALREADY_FOLLOWING: "Roger that. Following.",
+    RESP_STOP_ACCEPT: "Stopping here.",
+    RESP_NOT_FOLLOWING: "I'm not moving.",
+    RESP_MOVE_ACCEPT: "Moving to position.",
+    RESP_HOLD_ACCEPT: "Holding position.",
+    RESP_RETREAT_ACCEPT: "Falling back!",
+    RESP_REGROUP_ACCEPT: "On me, regroup!",
     
     # Combat
-    "RESP_ENGAGE_ACCEPT": "Engaging target!",
-    "RESP_NO_TARGET": "I don't see a target.",
-    "RESP_SUPPRESS_ACCEPT": "Laying down suppressing fire!",
-    "RESP_OVERWATCH_ACCEPT": "Eyes on the area.",
-    "RESP_COVER_ACCEPT": "Taking cover.",
-    "RESP_CLEAR_ACCEPT": "Clearing the area.",
+    RESP_ENGAGE_ACCEPT: "Engaging target!",
+    RESP_NO_TARGET: "I don't see a target.",
+    RESP_SUPPRESS_ACCEPT: "Laying down suppressing fire!",
+    RESP_OVERWATCH_ACCEPT: "Eyes on the area.",
+    RESP_COVER_ACCEPT: "Taking cover.",
+    RESP_CLEAR_ACCEPT: "Clearing the area.",
     
     # Interaction
-    "RESP_PICKUP_ACCEPT": "Got it.",
-    "RESP_INTERACT_ACCEPT": "Interacting.",
-    "RESP_USE_ITEM_ACCEPT": "Using item.",
-    "RESP_THROW_ACCEPT": "Throwing!",
+    RESP_PICKUP_ACCEPT: "Got it.",
+    RESP_INTERACT_ACCEPT: "Interacting.",
+    RESP_USE_ITEM_ACCEPT: "Using item.",
+    RESP_THROW_ACCEPT: "Throwing!",
     
     # General
-    "RESP_CANCEL_ACCEPT": "Cancelled.",
-    "RESP_UNKNOWN_COMMAND": "I didn't understand that command.",
-    "RESP_UNSUPPORTED_ACTION": "I don't know how to do that yet."
+    RESP_CANCEL_ACCEPT: "Cancelled.",
+    RESP_UNKNOWN_COMMAND: "I didn't understand that command.",
+    RESP_UNSUPPORTED_ACTION: "I don't know how to do that yet."
 }
 
+# Read-only view: the mapping is fixed at import and must not be mutated at runtime
+DIALOGUE_MAP = types.MappingProxyType(_DIALOGUE_MAP)
+
 
 # ============================================================================
 # Mock Unreal Engine Configuration
@@ -120,6 +186,18 @@ DIALOGUE_MAP = {
 DEFAULT_COMPANION_ID = "companion_01"
 
 
+@functools.cache
+def debug_validate_responses() -> bool:
+    """
+    Whether to re-validate every generated response against RESPONSE_SCHEMA.
+    
+    The engine builds responses itself, so this is a debugging aid only.
+    Enable with DEBUG_VALIDATE_RESPONSES=1 (environment or .env).
+    """
+    load_env()
+    return os.environ.get("DEBUG_VALIDATE_RESPONSES", "0") == "1"
+
+
 # ============================================================================
 # Logging Configuration
 # ============================================================================
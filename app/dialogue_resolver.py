@@ -7,13 +7,32 @@ The mapping is deterministic and defined in config.py.
 """
 
 import logging
+from operator import itemgetter
 from typing import Dict, Any, List
-from .config import DIALOGUE_MAP
+from .config import DIALOGUE_MAP, _DIALOGUE_MAP
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Fallback text for ids missing from DIALOGUE_MAP
+_UNKNOWN_FMT = "[Unknown response: %s]".__mod__
+
+
+def _unknown_dialogue(response_id: str) -> str:
+    """
+    Build the fallback text for a response_id with no dialogue mapping.
+    
+    Args:
+        response_id: Response identifier from UE
+        
+    Returns:
+        Placeholder dialogue text
+    """
+    logger.warning("Unknown response_id: %s", response_id)
+    return _UNKNOWN_FMT(response_id)
+
+
 class DialogueResolver:
     """
     Resolves response_id to dialogue text.
@@ -23,7 +42,10 @@ class DialogueResolver:
     def __init__(self):
         """Initialize the dialogue resolver."""
         self.dialogue_map = DIALOGUE_MAP
-        logger.info(f"Dialogue Resolver initialized with {len(self.dialogue_map)} mappings")
+        # Bound once on the underlying dict: each lookup is a single hash
+        # probe, without the MappingProxyType indirection
+        self._lookup = _DIALOGUE_MAP.get
+        logger.info("Dialogue Resolver initialized with %d mappings", len(self.dialogue_map))
     
     def resolve(self, response: Dict[str, Any]) -> List[str]:
         """
@@ -35,32 +57,23 @@ class DialogueResolver:
         Returns:
             List of dialogue strings (one per action)
         """
-        dialogues = []
-        
-        for action_result in response["actions"]:
-            response_id = action_result["response_id"]
-            dialogue = self._lookup_dialogue(response_id)
-            dialogues.append(dialogue)
-        
-        return dialogues
-    
-    def _lookup_dialogue(self, response_id: str) -> str:
-        """
-        Look up dialogue text for a response_id.
-        
-        Args:
-            response_id: Response identifier from UE
-            
-        Returns:
-            Dialogue text string
-        """
-        if response_id not in self.dialogue_map:
-            logger.warning(f"Unknown response_id: {response_id}")
-            return f"[Unknown response: {response_id}]"
-        
-        dialogue = self.dialogue_map[response_id]
-        logger.debug(f"Resolved {response_id} → '{dialogue}'")
-        return dialogue
+        lookup = self._lookup
+        return [
+            lookup(response_id) or _unknown_dialogue(response_id)
+            for response_id in map(itemgetter("response_id"), response["actions"])
+        ]
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+# Created at import time, like the mock UE: module import is serialized by
+# the import lock, so every request thread sees the same instance.
+_resolver_instance = DialogueResolver()
+
+def get_dialogue_resolver() -> DialogueResolver:
+    return _resolver_instance
 
 
 # ============================================================================
@@ -77,5 +90,4 @@ def resolve_dialogue(response: Dict[str, Any]) -> List[str]:
     Returns:
         List of dialogue strings (one per action)
     """
-    resolver = DialogueResolver()
-    return resolver.resolve(response)
+    return get_dialogue_resolver().resolve(response)
@@ -0,0 +1,84 @@
+"""
+Fast Classifier - Rule-Based Intent Shortcut
+
+Resolves the most common, unambiguous player phrases ("follow me",
+"wait here", "attack that enemy", ...) straight to a command without
+calling the LLM. Each rule must match the WHOLE normalized input, so
+anything with extra detail ("follow me to the left", "don't follow me")
+still goes to the Intent Compiler.
+
+This module is responsible ONLY for:
+1. Matching normalized input against a closed set of phrase patterns
+2. Building the same command structure the LLM would emit
+
+It does NOT:
+- Guess at partial or ambiguous matches
+- Access game state
+"""
+
+import itertools
+import re
+from typing import Dict, Any, Optional
+
+from .config import DEFAULT_COMPANION_ID
+
+
+# ============================================================================
+# Phrase Rules: pattern -> (action type, target descriptors, category hint)
+# ============================================================================
+
+# Only action types the Intent Compiler prompt offers, so a phrase compiles
+# the same way with or without the LLM and always has dialogue to resolve to
+_RULES = [
+    (r"(?:follow|come with|stick with|stay with) me", "follow", ["player"], "player"),
+    (r"(?:wait|stay) (?:here|there)", "hold_position", None, None),
+    (r"hold (?:your |this )?position", "hold_position", None, None),
+    (r"(?:attack|engage|kill) (?:that|the) (?:enemy|target)", "engage", ["enemy"], "enemy"),
+]
+
+# One alternation with a named group per rule; fullmatch keeps it anchored
+_PATTERN = re.compile("|".join(f"(?P<r{i}>{rule[0]})" for i, rule in enumerate(_RULES)))
+
+_TRAILING_PUNCTUATION = ".!?"
+
+_command_ids = itertools.count(1)
+
+
+def _normalize(text_input: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return " ".join(text_input.lower().split()).rstrip(_TRAILING_PUNCTUATION)
+
+
+def fast_match(text_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Build a command for a known phrase without calling the LLM.
+
+    Args:
+        text_input: Natural language command from player
+
+    Returns:
+        Command dictionary matching COMMAND_SCHEMA, or None if the input
+        is not one of the known phrases
+    """
+    match = _PATTERN.fullmatch(_normalize(text_input))
+    if match is None:
+        return None
+
+    _, action_type, descriptors, category_hint = _RULES[int(match.lastgroup[1:])]
+    action = {
+        "action_id": "act_001",
+        "type": action_type,
+        "parameters": {},
+        "assigned_to": DEFAULT_COMPANION_ID,
+        "priority": "normal",
+        "depends_on": None
+    }
+    if descriptors is not None:
+        action["target"] = {"descriptors": list(descriptors), "category_hint": category_hint}
+
+    return {
+        "command_id": f"cmd_fast_{next(_command_ids):03d}",
+        "actions": [action],
+        "dialogue_context": text_input,
+        "requires_clarification": False
+    }
@@ -14,22 +14,226 @@ It does NOT:
 - Make decisions about success/failure
 """
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any, Optional
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from . import _json
 from .schema import validate_command, pretty_print_json
+from .semantic_cache import SemanticCache
+from .fast_classifier import fast_match
 from .config import (
     OLLAMA_BASE_URL,
     OLLAMA_MODEL,
     LLM_TEMPERATURE,
     LLM_MAX_RETRIES,
-    INTENT_COMPILER_SYSTEM_PROMPT
+    LLM_MAX_TOKENS,
+    load_env,
+    get_intent_prompt,
+    get_settings
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Body of the first ``` or ```json block; the unrolled loop lets single
+# backticks through without the backtracking of a lazy .*?
+_CODE_FENCE = re.compile(r"```(?:json)?([^`]*(?:`(?!``)[^`]*)*)```")
+_FENCE_OPEN = re.compile(r"```")
+
+
+class _JsonObjectScanner:
+    """Collect streamed reply text up to where its top-level JSON object ends."""
+    
+    __slots__ = ("depth", "in_string", "escaped", "scanned", "start", "parts", "complete")
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.scanned = 0  # Length of the reply fed so far
+        self.start = -1  # Offset of the object's opening brace in the reply
+        self.parts: List[str] = []
+        self.complete = False
+    
+    def add(self, chunk: Any) -> bool:
+        """
+        Take the next chunk of a streaming chat completion.
+        
+        Args:
+            chunk: Chunk yielded by the (sync or async) stream
+            
+        Returns:
+            True once the top-level object is complete and reading can stop
+        """
+        if not chunk.choices:
+            return False
+        content = chunk.choices[0].delta.content
+        if not content:
+            return False
+        end = self.feed(content)
+        if end >= 0:
+            self.parts.append(content[:end])
+            self.complete = True
+            return True
+        self.parts.append(content)
+        return False
+    
+    def feed(self, chunk: str) -> int:
+        """
+        Scan the next chunk of reply text.
+        
+        Args:
+            chunk: Text appended to the reply
+            
+        Returns:
+            Index just past the closing brace in this chunk, or -1 if the
+            top-level object is not complete yet
+        """
+        for index, char in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                if self.depth == 0:
+                    self.start = self.scanned + index
+                self.depth += 1
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    return index + 1
+        self.scanned += len(chunk)
+        return -1
+    
+    def text(self) -> str:
+        """
+        Return the collected reply text.
+        
+        Reading stops at the closing brace, so a code fence's closing ```
+        never arrives and _CODE_FENCE could not match; for a fenced reply
+        only the bare object is returned.
+        """
+        reply = "".join(self.parts)
+        if self.complete and _FENCE_OPEN.search(reply, 0, self.start):
+            return reply[self.start:]
+        return reply
+
+
+# ============================================================================
+# Compiled Command Cache
+# ============================================================================
+
+class CommandCache:
+    """
+    Thread-safe LRU cache of validated commands keyed by normalized input.
+    
+    Commands are stored serialized, so every hit returns a fresh dict
+    that callers (e.g. the mock UE filling in assigned_to) may mutate.
+    The cache lives in process memory only, so it never outlives a
+    schema or prompt change.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(text_input: str) -> str:
+        """Normalize case and whitespace so trivial variations share an entry."""
+        return " ".join(text_input.lower().split())
+    
+    def get(self, text_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously compiled command.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            A fresh copy of the cached command, or None on a miss
+        """
+        key = self._key(text_input)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            self._entries.move_to_end(key)
+        return _json.loads(cached)
+    
+    def put(self, text_input: str, command: Dict[str, Any]) -> None:
+        """
+        Store a validated command, evicting the least recently used entry.
+        
+        Args:
+            text_input: Natural language command from player
+            command: Command that passed schema validation
+        """
+        if self.maxsize <= 0:
+            return
+        key = self._key(text_input)
+        serialized = _json.dumps(command)
+        with self._lock:
+            self._entries[key] = serialized
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached commands."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Where a compiled command came from (see IntentCompiler.compile_with_source)
+SOURCE_CACHE = "cache"
+SOURCE_FAST_PATH = "fast_path"
+SOURCE_SEMANTIC_CACHE = "semantic_cache"
+SOURCE_LLM = "llm"
+
+
+@functools.cache
+def get_ollama_client() -> OpenAI:
+    """Get the shared Ollama client, so one connection pool serves every caller."""
+    load_env()
+    return OpenAI(
+        api_key="ollama",  # Ollama doesn't need a real key
+        base_url=OLLAMA_BASE_URL
+    )
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def get_async_ollama_client() -> AsyncOpenAI:
+    """
+    Get the shared async Ollama client of the running event loop.
+    
+    Async connections belong to the loop that opened them, so one client
+    is kept per loop instead of one per process.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        load_env()
+        client = _async_clients[loop] = AsyncOpenAI(
+            api_key="ollama",  # Ollama doesn't need a real key
+            base_url=OLLAMA_BASE_URL
+        )
+    return client
+
 
 class IntentCompiler:
     """
@@ -39,12 +243,22 @@ class IntentCompiler:
     
     def __init__(self):
         """Initialize the Ollama client via OpenAI-compatible API."""
-        self.client = OpenAI(
-            api_key="ollama",  # Ollama doesn't need a real key
-            base_url=OLLAMA_BASE_URL
-        )
+        self.client = get_ollama_client()
         self.model = OLLAMA_MODEL
-        logger.info(f"Intent Compiler initialized with local model: {self.model}")
+        self.system_prompt = get_intent_prompt()
+        # Shared by every request; the client only reads it
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        
+        # Sized from the environment here rather than at import, after .env is loaded
+        settings = get_settings()
+        self.fast_path_enabled = settings.fast_path_enabled
+        self.embedding_model = settings.semantic_cache_model
+        self.command_cache = CommandCache(settings.intent_cache_size)
+        self.semantic_cache = (
+            SemanticCache(settings.semantic_cache_size, settings.semantic_cache_threshold)
+            if self.embedding_model else None
+        )
+        logger.info("Intent Compiler initialized with local model: %s", self.model)
     
     def compile(self, text_input: str) -> Optional[Dict[str, Any]]:
         """
@@ -56,73 +270,425 @@ class IntentCompiler:
         Returns:
             Dictionary containing the structured command, or None if failed
         """
-        logger.info(f"Compiling intent from input: '{text_input}'")
+        return self.compile_with_source(text_input)[0]
+    
+    def compile_with_source(self, text_input: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Compile text input and report which step produced the command.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            Tuple of (command or None if failed, one of the SOURCE_* values);
+            a failed compile reports SOURCE_LLM
+        """
+        resolved = self._resolve_locally(text_input)
+        if resolved is not None:
+            return resolved
+        
+        embedding = self._embed(text_input)
+        resolved = self._resolve_semantically(text_input, embedding)
+        if resolved is not None:
+            return resolved
         
+        return self._compile_with_llm(text_input, embedding)
+    
+    def _compile_with_llm(self, text_input: str, embedding: Optional[List[float]]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Retry loop of compile_with_source(), once the caches and fast path missed.
+        
+        Args:
+            text_input: Natural language command from player
+            embedding: Embedding of the input for the semantic cache, or None
+            
+        Returns:
+            Tuple of (command or None if failed, SOURCE_LLM)
+        """
         for attempt in range(1, LLM_MAX_RETRIES + 1):
             try:
-                # Create the prompt
-                user_prompt = self._create_prompt(text_input)
-                
                 # Call Ollama via OpenAI-compatible API
-                logger.debug(f"Attempt {attempt}/{LLM_MAX_RETRIES}: Calling Ollama ({self.model})...")
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    temperature=LLM_TEMPERATURE,
-                    max_tokens=1024,
-                    messages=[
-                        {"role": "system", "content": INTENT_COMPILER_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                )
-                
-                # Extract text response
-                raw_output = response.choices[0].message.content.strip()
-                logger.debug(f"Raw LLM output:\n{raw_output}")
-                
-                if not raw_output:
-                    logger.warning(f"Attempt {attempt}: Empty response from Ollama")
-                    continue
-                
-                # Parse JSON
-                command = self._parse_json(raw_output)
-                if command is None:
-                    logger.warning(f"Attempt {attempt}: Failed to parse JSON")
-                    logger.debug(f"Raw output was: {raw_output[:200]}...")
-                    continue
-                
-                # Validate against schema
-                is_valid, error_msg = validate_command(command)
-                if not is_valid:
-                    logger.warning(f"Attempt {attempt}: Schema validation failed: {error_msg}")
-                    continue
-                
-                # Success!
-                logger.info("✓ Successfully compiled valid JSON command")
-                logger.debug(f"Validated command:\n{pretty_print_json(command)}")
-                return command
-                
+                stream = self.client.chat.completions.create(**self._attempt_request(attempt, text_input))
+                command = self._accept(attempt, text_input, self._read_stream(stream), embedding)
+                if command is not None:
+                    return command, SOURCE_LLM
+            except Exception as e:
+                self._attempt_failed(attempt, e)
+        
+        return self._retries_exhausted()
+    
+    async def acompile(self, text_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of compile(), using the event loop's shared client.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            Dictionary containing the structured command, or None if failed
+        """
+        return (await self.acompile_with_source(text_input))[0]
+    
+    async def acompile_with_source(self, text_input: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Async variant of compile_with_source(); only the client calls are awaited.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            Tuple of (command or None if failed, one of the SOURCE_* values)
+        """
+        resolved = self._resolve_locally(text_input)
+        if resolved is not None:
+            return resolved
+        
+        client = get_async_ollama_client()
+        embedding = await self._aembed(client, text_input)
+        resolved = self._resolve_semantically(text_input, embedding)
+        if resolved is not None:
+            return resolved
+        
+        for attempt in range(1, LLM_MAX_RETRIES + 1):
+            try:
+                stream = await client.chat.completions.create(**self._attempt_request(attempt, text_input))
+                command = self._accept(attempt, text_input, await self._aread_stream(stream), embedding)
+                if command is not None:
+                    return command, SOURCE_LLM
             except Exception as e:
-                logger.error(f"Attempt {attempt}: Unexpected error: {str(e)}")
-                logger.debug(f"Exception details:", exc_info=True)
-                continue
+                self._attempt_failed(attempt, e)
+        
+        return self._retries_exhausted()
+    
+    async def acompile_many(self, text_inputs: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Compile several inputs concurrently with asyncio.gather.
+        
+        The requests overlap on the network and, up to Ollama's
+        OLLAMA_NUM_PARALLEL setting, on the model server.
+        
+        Args:
+            text_inputs: Natural language commands from players
+            
+        Returns:
+            One structured command (or None if failed) per input, in order
+        """
+        return list(await asyncio.gather(*(self.acompile(text_input) for text_input in text_inputs)))
+    
+    def _resolve_locally(self, text_input: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Look the input up in the command cache, then try the fast path.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            Tuple of (command, source) resolved without any model call, or None
+        """
+        logger.info("Compiling intent from input: '%s'", text_input)
         
-        # All retries exhausted
-        logger.error(f"Failed to compile valid JSON after {LLM_MAX_RETRIES} attempts")
+        cached = self.command_cache.get(text_input)
+        if cached is not None:
+            logger.info("✓ Command cache hit")
+            return cached, SOURCE_CACHE
+        
+        if self.fast_path_enabled:
+            command = fast_match(text_input)
+            if command is not None:
+                logger.info("✓ Resolved by fast path: %s", command["actions"][0]["type"])
+                return command, SOURCE_FAST_PATH
         return None
     
+    def _resolve_semantically(self, text_input: str, embedding: Optional[List[float]]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Reuse the command of a similarly worded earlier input.
+        
+        Args:
+            text_input: Natural language command from player
+            embedding: Embedding of the input, or None if unavailable
+            
+        Returns:
+            Tuple of (command, source) of the nearest earlier input, or None
+        """
+        if embedding is None:
+            return None
+        cached = self.semantic_cache.lookup(embedding)
+        if cached is None:
+            return None
+        logger.info("✓ Semantic cache hit")
+        self.command_cache.put(text_input, cached)
+        return cached, SOURCE_SEMANTIC_CACHE
+    
+    def _remember(self, text_input: str, command: Dict[str, Any], embedding: Optional[List[float]]) -> None:
+        """Store a command the LLM compiled in the exact and semantic caches."""
+        self.command_cache.put(text_input, command)
+        if embedding is not None:
+            self.semantic_cache.add(embedding, command)
+    
+    # ------------------------------------------------------------------------
+    # Retry loop steps shared by compile_with_source() and acompile_with_source()
+    # ------------------------------------------------------------------------
+    
+    def _attempt_request(self, attempt: int, text_input: str) -> Dict[str, Any]:
+        """Log the attempt and build its chat completion arguments."""
+        logger.debug("Attempt %d/%d: Calling Ollama (%s)...", attempt, LLM_MAX_RETRIES, self.model)
+        return self._request_kwargs(self._create_prompt(text_input))
+    
+    def _accept(self, attempt: int, text_input: str, raw_output: str,
+                embedding: Optional[List[float]]) -> Optional[Dict[str, Any]]:
+        """Validate one reply and cache the command if it passed."""
+        command = self._handle_output(attempt, raw_output)
+        if command is not None:
+            self._remember(text_input, command, embedding)
+        return command
+    
+    def _attempt_failed(self, attempt: int, error: Exception) -> None:
+        """Log an attempt that raised."""
+        logger.error("Attempt %d: Unexpected error: %s", attempt, error)
+        logger.debug("Exception details:", exc_info=True)
+    
+    def _retries_exhausted(self) -> Tuple[None, str]:
+        """Log the final failure once every attempt is used up."""
+        logger.error("Failed to compile valid JSON after %d attempts", LLM_MAX_RETRIES)
+        return None, SOURCE_LLM
+    
+    def compile_batch(self, text_inputs: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Compile several inputs with a single LLM call.
+        
+        Inputs the caches or the fast path resolve are answered first, as
+        in compile(). The rest are sent in one request, so the system prompt
+        is processed once for the whole batch, and the model answers with
+        one command per input. Inputs whose command is missing or invalid
+        go through compile()'s per-input retry loop.
+        
+        Args:
+            text_inputs: Natural language commands from players
+            
+        Returns:
+            One structured command (or None if failed) per input, in order
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        embeddings: Dict[int, Optional[List[float]]] = {}
+        for index, text_input in enumerate(text_inputs):
+            resolved = self._resolve_locally(text_input)
+            if resolved is None:
+                embeddings[index] = self._embed(text_input)
+                resolved = self._resolve_semantically(text_input, embeddings[index])
+            if resolved is None:
+                results.append(None)
+            else:
+                results.append(resolved[0])
+                embeddings.pop(index, None)
+        
+        pending = list(embeddings)
+        if len(pending) > 1:
+            batch = [text_inputs[index] for index in pending]
+            for index, command in zip(pending, self._compile_together(batch)):
+                if command is not None:
+                    self._remember(text_inputs[index], command, embeddings[index])
+                    results[index] = command
+        
+        for index in pending:
+            if results[index] is None:
+                results[index] = self._compile_with_llm(text_inputs[index], embeddings[index])[0]
+        return results
+    
+    def _compile_together(self, text_inputs: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Make one LLM call for several inputs.
+        
+        Args:
+            text_inputs: Natural language commands from players
+            
+        Returns:
+            Validated command (or None) per input, in order
+        """
+        logger.info("Compiling batch of %d inputs in one call", len(text_inputs))
+        failed = [None] * len(text_inputs)
+        try:
+            stream = self.client.chat.completions.create(**self._request_kwargs(
+                self._create_batch_prompt(text_inputs), max_tokens=LLM_MAX_TOKENS * len(text_inputs)
+            ))
+            raw_output = self._read_stream(stream)
+        except Exception as e:
+            logger.error("Batch call failed: %s", e)
+            logger.debug("Exception details:", exc_info=True)
+            return failed
+        
+        output = self._parse_json(raw_output.strip())
+        commands = output.get("commands") if isinstance(output, dict) else None
+        if not isinstance(commands, list) or len(commands) != len(text_inputs):
+            logger.warning("Batch output is not a list of %d commands", len(text_inputs))
+            return failed
+        
+        results = []
+        for text_input, command in zip(text_inputs, commands):
+            is_valid, error_msg = validate_command(command)
+            if not is_valid:
+                logger.warning("Batch command for '%s' failed validation: %s", text_input, error_msg)
+                command = None
+            results.append(command)
+        return results
+    
+    def _embed(self, text_input: str) -> Optional[List[float]]:
+        """
+        Embed the input for the semantic cache.
+        
+        Args:
+            text_input: Natural language command from player
+            
+        Returns:
+            Embedding vector, or None if the semantic cache is disabled or the call failed
+        """
+        if self.semantic_cache is None:
+            return None
+        try:
+            return self.client.embeddings.create(model=self.embedding_model, input=text_input).data[0].embedding
+        except Exception as e:
+            return self._embedding_failed(e)
+    
+    async def _aembed(self, client: AsyncOpenAI, text_input: str) -> Optional[List[float]]:
+        """Async variant of _embed(), awaiting the given async client."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            return (await client.embeddings.create(model=self.embedding_model, input=text_input)).data[0].embedding
+        except Exception as e:
+            return self._embedding_failed(e)
+    
+    def _embedding_failed(self, error: Exception) -> None:
+        """Log a failed embedding call; the input then skips the semantic cache."""
+        logger.warning("Embedding failed, skipping semantic cache: %s", error)
+    
+    def _request_kwargs(self, user_prompt: str, max_tokens: int = LLM_MAX_TOKENS) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments for one attempt.
+        
+        JSON mode makes Ollama constrain sampling to a single JSON object,
+        so replies no longer fail to parse or trail off into prose. Replies
+        are streamed so reading can stop at the object's closing brace.
+        
+        Args:
+            user_prompt: User message built by _create_prompt or _create_batch_prompt
+            max_tokens: Generation budget for the reply
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return {
+            "model": self.model,
+            "temperature": LLM_TEMPERATURE,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"},
+            "stream": True,
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": user_prompt}
+            ]
+        }
+    
+    def _read_stream(self, stream: Any) -> str:
+        """
+        Collect streamed reply text up to the end of the first JSON object.
+        
+        The stream is closed as soon as the object is complete, which stops
+        Ollama generating trailing whitespace, commentary or a closing fence.
+        
+        Args:
+            stream: Streaming chat completion returned by the client
+            
+        Returns:
+            Reply text, ending at the closing brace when one was seen
+        """
+        scanner = _JsonObjectScanner()
+        try:
+            for chunk in stream:
+                if scanner.add(chunk):
+                    break
+        finally:
+            stream.close()
+        return scanner.text()
+    
+    async def _aread_stream(self, stream: Any) -> str:
+        """Async variant of _read_stream()."""
+        scanner = _JsonObjectScanner()
+        try:
+            async for chunk in stream:
+                if scanner.add(chunk):
+                    break
+        finally:
+            await stream.close()
+        return scanner.text()
+    
+    def _handle_output(self, attempt: int, raw_output: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse and validate the command from one LLM reply.
+        
+        Args:
+            attempt: Attempt number (for logging)
+            raw_output: Reply text collected from the stream
+            
+        Returns:
+            Validated command dictionary, or None if this attempt failed
+        """
+        raw_output = raw_output.strip()
+        logger.debug("Raw LLM output:\n%s", raw_output)
+        
+        if not raw_output:
+            logger.warning("Attempt %d: Empty response from Ollama", attempt)
+            return None
+        
+        # Parse JSON
+        command = self._parse_json(raw_output)
+        if command is None:
+            logger.warning("Attempt %d: Failed to parse JSON", attempt)
+            logger.debug("Raw output was: %.200s...", raw_output)
+            return None
+        
+        # Validate against schema
+        is_valid, error_msg = validate_command(command)
+        if not is_valid:
+            logger.warning("Attempt %d: Schema validation failed: %s", attempt, error_msg)
+            return None
+        
+        # Success!
+        logger.info("✓ Successfully compiled valid JSON command")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validated command:\n%s", pretty_print_json(command))
+        return command
+    
     def _create_prompt(self, text_input: str) -> str:
         """
         Create the user prompt for the LLM.
         
+        All instructions live in the system prompt, which is byte-identical
+        on every call so Ollama can reuse its KV cache for that prefix;
+        only this short suffix varies per request.
+        
         Args:
             text_input: User's natural language input
             
         Returns:
             Complete prompt string
         """
-        return f"""Player input: "{text_input}"
-
-Generate the JSON command following the schema exactly. Output ONLY the JSON, no explanations."""
+        return f'Player input: "{text_input}"'
+    
+    def _create_batch_prompt(self, text_inputs: List[str]) -> str:
+        """
+        Create the user prompt for a batch of inputs.
+        
+        The system prompt, shared with single inputs, describes the
+        {"commands": [...]} reply expected for a numbered list.
+        
+        Args:
+            text_inputs: User's natural language inputs
+            
+        Returns:
+            Complete prompt string
+        """
+        numbered = "\n".join(f'{number}. "{text_input}"' for number, text_input in enumerate(text_inputs, 1))
+        return f"Player inputs:\n{numbered}"
     
     def _parse_json(self, raw_output: str) -> Optional[Dict[str, Any]]:
         """
@@ -135,29 +701,40 @@ Generate the JSON command following the schema exactly. Output ONLY the JSON, no
             Parsed dictionary or None if parsing failed
         """
         # Try to extract JSON from markdown code blocks
-        if "```json" in raw_output:
-            try:
-                start = raw_output.index("```json") + 7
-                end = raw_output.index("```", start)
-                raw_output = raw_output[start:end].strip()
-            except ValueError:
-                pass
-        elif "```" in raw_output:
-            try:
-                start = raw_output.index("```") + 3
-                end = raw_output.index("```", start)
-                raw_output = raw_output[start:end].strip()
-            except ValueError:
-                pass
+        fenced = _CODE_FENCE.search(raw_output)
+        if fenced:
+            raw_output = fenced.group(1).strip()
         
         # Try to parse JSON
         try:
-            return json.loads(raw_output)
-        except json.JSONDecodeError as e:
-            logger.debug(f"JSON parse error: {str(e)}")
+            return _json.loads(raw_output)
+        except json.JSONDecodeError as e:  # also raised by orjson
+            logger.debug("JSON parse error: %s", e)
             return None
 
 
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_compiler_instance: Optional[IntentCompiler] = None
+_compiler_lock = threading.Lock()
+
+def get_intent_compiler() -> IntentCompiler:
+    """
+    Get the shared compiler, whose client keeps its Ollama connections alive.
+    
+    Built on first use, once .env can be loaded; the lock stops concurrent
+    first requests (Flask serves them on threads) from each building one.
+    """
+    global _compiler_instance
+    if _compiler_instance is None:
+        with _compiler_lock:
+            if _compiler_instance is None:
+                _compiler_instance = IntentCompiler()
+    return _compiler_instance
+
+
 # ============================================================================
 # Convenience function for direct usage
 # ============================================================================
@@ -172,5 +749,30 @@ def compile_intent(text_input: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing the structured command, or None if failed
     """
-    compiler = IntentCompiler()
-    return compiler.compile(text_input)
+    return get_intent_compiler().compile(text_input)
+
+
+def compile_intent_with_source(text_input: str) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Compile text input and report which step produced the command.
+    
+    Args:
+        text_input: Natural language command from player
+        
+    Returns:
+        Tuple of (command or None if failed, one of the SOURCE_* values)
+    """
+    return get_intent_compiler().compile_with_source(text_input)
+
+
+async def compile_intent_async(text_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of compile_intent().
+    
+    Args:
+        text_input: Natural language command from player
+        
+    Returns:
+        Dictionary containing the structured command, or None if failed
+    """
+    return await get_intent_compiler().acompile(text_input)
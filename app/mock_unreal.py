@@ -11,13 +11,114 @@ The LLM has NO say in feasibility - only UE decides.
 """
 
 import logging
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
 from .schema import validate_response, pretty_print_json
-from .config import DEFAULT_COMPANION_ID
+from .config import (
+    DEFAULT_COMPANION_ID,
+    RESP_ALREADY_FOLLOWING,
+    RESP_ASSIST_ACCEPT,
+    RESP_CANCEL_ACCEPT,
+    RESP_CLEAR_ACCEPT,
+    RESP_COVER_ACCEPT,
+    RESP_DEFEND_ACCEPT,
+    RESP_ENGAGE_ACCEPT,
+    RESP_FOLLOW_ACCEPT,
+    RESP_HOLD_ACCEPT,
+    RESP_INTERACT_ACCEPT,
+    RESP_MOVE_ACCEPT,
+    RESP_NOT_FOLLOWING,
+    RESP_NO_TARGET,
+    RESP_OVERWATCH_ACCEPT,
+    RESP_PICKUP_ACCEPT,
+    RESP_REGROUP_ACCEPT,
+    RESP_RETREAT_ACCEPT,
+    RESP_STOP_ACCEPT,
+    RESP_SUPPRESS_ACCEPT,
+    RESP_THROW_ACCEPT,
+    RESP_UNKNOWN_COMMAND,
+    RESP_UNSUPPORTED_ACTION,
+    RESP_USE_ITEM_ACCEPT,
+    debug_validate_responses
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Shared read-only defaults for actions without parameters / target (never mutated)
+_EMPTY_PARAMS = {}
+_EMPTY_TARGET = {"descriptors": (), "category_hint": "none"}
+
+
+def _result_template(executed_type: str, status: bool, reason: Optional[str], response_id: str) -> Dict[str, Any]:
+    """
+    Prebuild the constant part of an action result.
+    
+    _build_result copies it and fills in the per-action fields, so the
+    key order here is the key order of every result.
+    """
+    return {
+        "action_id": None,
+        "action_type_executed": executed_type,
+        "spatial_direction": None,
+        "status": status,
+        "reason": reason,
+        "companion_id": None,
+        "response_id": response_id
+    }
+
+
+# Outcomes of the stateful / conditional handlers
+_RESULT_FOLLOW_ACCEPT = _result_template("follow", True, None, RESP_FOLLOW_ACCEPT)
+_RESULT_ALREADY_FOLLOWING = _result_template("follow", False, "already_following", RESP_ALREADY_FOLLOWING)
+_RESULT_STOP_ACCEPT = _result_template("stop_follow", True, None, RESP_STOP_ACCEPT)
+_RESULT_NOT_FOLLOWING = _result_template("stop_follow", False, "not_following", RESP_NOT_FOLLOWING)
+_RESULT_HOLD_ACCEPT = _result_template("hold_position", True, None, RESP_HOLD_ACCEPT)
+_RESULT_ENGAGE_ACCEPT = _result_template("engage", True, None, RESP_ENGAGE_ACCEPT)
+_RESULT_NO_TARGET = _result_template("engage", False, "no_target", RESP_NO_TARGET)
+_RESULT_UNKNOWN_COMMAND = _result_template("unknown", False, "unknown_command", RESP_UNKNOWN_COMMAND)
+_RESULT_UNSUPPORTED_ACTION = _result_template("unknown", False, "unsupported_action", RESP_UNSUPPORTED_ACTION)
+
+
+# Stateless action types that always succeed: action type -> response_id
+_ALWAYS_ACCEPT = {
+    "defend": RESP_DEFEND_ACCEPT,
+    "assist": RESP_ASSIST_ACCEPT,
+    "move_to": RESP_MOVE_ACCEPT,
+    "take_cover": RESP_COVER_ACCEPT,
+    "suppress": RESP_SUPPRESS_ACCEPT,
+    "overwatch": RESP_OVERWATCH_ACCEPT,
+    "clear_area": RESP_CLEAR_ACCEPT,
+    "pick_up": RESP_PICKUP_ACCEPT,
+    "interact": RESP_INTERACT_ACCEPT,
+    "use_item_on": RESP_USE_ITEM_ACCEPT,
+    "throw_equipment": RESP_THROW_ACCEPT,
+    "retreat": RESP_RETREAT_ACCEPT,
+    "regroup": RESP_REGROUP_ACCEPT,
+    "cancel": RESP_CANCEL_ACCEPT
+}
+
+
+def _make_accept_handler(executed_type: str, response_id: str):
+    """Build a handler that always accepts with a fixed response_id."""
+    template = _result_template(executed_type, True, None, response_id)
+    
+    def handler(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        return self._build_result(action, template)
+    handler.__name__ = handler.__qualname__ = f"_execute_{executed_type}"
+    return handler
+
+
+@dataclass(slots=True)
+class CompanionState:
+    """Behavior state tracked for a single companion."""
+    is_following: bool = False
+    is_waiting: bool = False
+    is_defending: bool = False
+    following_target: Optional[str] = None
+    current_target: Optional[str] = None
+    location: str = "default_spawn"
+
 
 class MockUnrealEngine:
     """
@@ -27,17 +128,9 @@ class MockUnrealEngine:
     
     def __init__(self):
         """Initialize the mock UE environment."""
-        # Companion state: tracks all companion behaviors
-        self.companion_state = {
-            DEFAULT_COMPANION_ID: {
-                "is_following": False,
-                "is_waiting": False,
-                "is_defending": False,
-                "following_target": None,
-                "current_target": None,
-                "location": "default_spawn"
-            }
-        }
+        # Companion state: tracks all companion behaviors.
+        # Other companion ids get an entry once an action changes their state.
+        self.companion_state: Dict[str, CompanionState] = {DEFAULT_COMPANION_ID: CompanionState()}
         logger.info("Mock Unreal Engine initialized")
     
     def execute_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,29 +146,33 @@ class MockUnrealEngine:
         command_id = command["command_id"]
         actions = command["actions"]
         
-        logger.info(f"Executing command: {command_id}")
+        logger.info("Executing command: %s", command_id)
         
-        # Process each action
-        action_results = []
+        # Normalize once up front so handlers can index assigned_to directly
         for action in actions:
-            result = self._execute_action(action)
-            action_results.append(result)
+            if not action.get("assigned_to"):
+                action["assigned_to"] = DEFAULT_COMPANION_ID
         
-        # Build response
+        # Process each action and build response
+        execute_action = self._execute_action
         response = {
             "signal_type": "validation",
             "command_id": command_id,
-            "actions": action_results
+            "actions": [execute_action(action) for action in actions]
         }
         
-        # Validate response schema (sanity check)
-        is_valid, error_msg = validate_response(response)
-        if not is_valid:
-            logger.error(f"Generated invalid response: {error_msg}")
-            raise ValueError(f"Invalid response generated: {error_msg}")
+        # Validate response schema (sanity check, debug only).
+        # `if __debug__` blocks are compiled out entirely under `python -O`.
+        if __debug__:
+            if debug_validate_responses():
+                is_valid, error_msg = validate_response(response)
+                if not is_valid:
+                    logger.error("Generated invalid response: %s", error_msg)
+                    raise ValueError(f"Invalid response generated: {error_msg}")
         
         logger.info("✓ Command executed successfully")
-        logger.debug(f"Response:\n{pretty_print_json(response)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response:\n%s", pretty_print_json(response))
         
         return response
     
@@ -84,174 +181,107 @@ class MockUnrealEngine:
         Dispatcher for actions.
          Strictly maps action['type'] to a handler function.
         """
-        action_type = action["type"]
-        
-        # Dispatch Table
-        dispatch_table = {
-            "follow": self._execute_follow,
-            "stop_follow": self._execute_stop_follow,
-            "wait": self._execute_wait,
-            "attack": self._execute_engage,      # Legacy support
-            "engage": self._execute_engage,
-            "defend": self._execute_defend,
-            "assist": self._execute_assist,
-            "move_to": self._execute_move_to,
-            "hold_position": self._execute_hold_position,
-            "take_cover": self._execute_take_cover,
-            "suppress": self._execute_suppress,
-            "overwatch": self._execute_overwatch,
-            "clear_area": self._execute_clear_area,
-            "pick_up": self._execute_pick_up,
-            "interact": self._execute_interact,
-            "use_item_on": self._execute_use_item_on,
-            "throw_equipment": self._execute_throw_equipment,
-            "retreat": self._execute_retreat,
-            "regroup": self._execute_regroup,
-            "cancel": self._execute_cancel,
-            "unknown": self._execute_unknown
-        }
-        
-        if action_type not in dispatch_table:
-            return {
-                "action_id": action["action_id"],
-                "action_type_executed": "unknown",
-                "status": False,
-                "reason": "unsupported_action",
-                "companion_id": action.get("assigned_to", "unknown"),
-                "spatial_direction": None,
-                "response_id": "RESP_UNSUPPORTED_ACTION"
-            }
+        handler = self._DISPATCH.get(action["type"])
+        if handler is None:
+            # Not executed, so no spatial_direction is echoed back
+            result = _RESULT_UNSUPPORTED_ACTION.copy()
+            result["action_id"] = action["action_id"]
+            result["companion_id"] = action["assigned_to"]
+            return result
             
-        handler = dispatch_table[action_type]
-        return handler(action)
+        return handler(self, action)
 
     # =========================================================================
     # Action Handlers
     # =========================================================================
 
+    def _state_of(self, action: Dict[str, Any]) -> CompanionState:
+        """State of the action's companion, created when an action first changes it."""
+        companion_id = action["assigned_to"]
+        state = self.companion_state.get(companion_id)
+        if state is None:
+            state = self.companion_state[companion_id] = CompanionState()
+        return state
+
     def _execute_follow(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        companion_id = action.get("assigned_to", DEFAULT_COMPANION_ID)
-        state = self.companion_state.get(companion_id, {})
+        state = self.companion_state.get(action["assigned_to"])
         
-        if state.get("is_following"):
-            return self._build_result(action, "follow", False, "already_following", "RESP_ALREADY_FOLLOWING")
+        if state is not None and state.is_following:
+            return self._build_result(action, _RESULT_ALREADY_FOLLOWING)
         
-        state["is_following"] = True
-        return self._build_result(action, "follow", True, None, "RESP_FOLLOW_ACCEPT")
+        self._state_of(action).is_following = True
+        return self._build_result(action, _RESULT_FOLLOW_ACCEPT)
 
     def _execute_stop_follow(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        companion_id = action.get("assigned_to", DEFAULT_COMPANION_ID)
-        state = self.companion_state.get(companion_id, {})
+        state = self.companion_state.get(action["assigned_to"])
         
-        if not state.get("is_following"):
-            return self._build_result(action, "stop_follow", False, "not_following", "RESP_NOT_FOLLOWING")
+        if state is None or not state.is_following:
+            return self._build_result(action, _RESULT_NOT_FOLLOWING)
         
-        state["is_following"] = False
-        return self._build_result(action, "stop_follow", True, None, "RESP_STOP_ACCEPT")
+        state.is_following = False
+        return self._build_result(action, _RESULT_STOP_ACCEPT)
 
     def _execute_wait(self, action: Dict[str, Any]) -> Dict[str, Any]:
         # Alias for Hold Position
         return self._execute_hold_position(action)
 
     def _execute_hold_position(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        companion_id = action.get("assigned_to", DEFAULT_COMPANION_ID)
-        state = self.companion_state.get(companion_id, {})
+        state = self._state_of(action)
         
-        state["is_following"] = False
-        state["is_waiting"] = True
-        return self._build_result(action, "hold_position", True, None, "RESP_HOLD_ACCEPT")
+        state.is_following = False
+        state.is_waiting = True
+        return self._build_result(action, _RESULT_HOLD_ACCEPT)
 
     def _execute_engage(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        target = action.get("target", {})
-        descriptors = target.get("descriptors", [])
+        target = action.get("target") or _EMPTY_TARGET
         
-        if not descriptors:
-            return self._build_result(action, "engage", False, "no_target", "RESP_NO_TARGET")
+        # A missing key reads as None, which fails the same truthiness test as []
+        if not target.get("descriptors"):
+            return self._build_result(action, _RESULT_NO_TARGET)
             
-        return self._build_result(action, "engage", True, None, "RESP_ENGAGE_ACCEPT")
-
-    def _execute_defend(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "defend", True, None, "RESP_DEFEND_ACCEPT")
-
-    def _execute_assist(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "assist", True, None, "RESP_ASSIST_ACCEPT")
-
-    def _execute_move_to(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "move_to", True, None, "RESP_MOVE_ACCEPT")
-
-    def _execute_take_cover(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "take_cover", True, None, "RESP_COVER_ACCEPT")
-
-    def _execute_suppress(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "suppress", True, None, "RESP_SUPPRESS_ACCEPT")
-
-    def _execute_overwatch(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "overwatch", True, None, "RESP_OVERWATCH_ACCEPT")
-
-    def _execute_clear_area(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "clear_area", True, None, "RESP_CLEAR_ACCEPT")
-
-    def _execute_pick_up(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "pick_up", True, None, "RESP_PICKUP_ACCEPT")
-
-    def _execute_interact(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "interact", True, None, "RESP_INTERACT_ACCEPT")
-
-    def _execute_use_item_on(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "use_item_on", True, None, "RESP_USE_ITEM_ACCEPT")
-
-    def _execute_throw_equipment(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "throw_equipment", True, None, "RESP_THROW_ACCEPT")
-
-    def _execute_retreat(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "retreat", True, None, "RESP_RETREAT_ACCEPT")
-
-    def _execute_regroup(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "regroup", True, None, "RESP_REGROUP_ACCEPT")
-
-    def _execute_cancel(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "cancel", True, None, "RESP_CANCEL_ACCEPT")
+        return self._build_result(action, _RESULT_ENGAGE_ACCEPT)
 
     def _execute_unknown(self, action: Dict[str, Any]) -> Dict[str, Any]:
-        return self._build_result(action, "unknown", False, "unknown_command", "RESP_UNKNOWN_COMMAND")
+        return self._build_result(action, _RESULT_UNKNOWN_COMMAND)
+
+    # Dispatch Table (built once at class creation; handlers are plain functions here)
+    _DISPATCH = {
+        "follow": _execute_follow,
+        "stop_follow": _execute_stop_follow,
+        "wait": _execute_wait,
+        "attack": _execute_engage,      # Legacy support
+        "engage": _execute_engage,
+        "hold_position": _execute_hold_position,
+        "unknown": _execute_unknown,
+        **{
+            action_type: _make_accept_handler(action_type, response_id)
+            for action_type, response_id in _ALWAYS_ACCEPT.items()
+        }
+    }
 
-    def _build_result(self, action, executed_type, status, reason, response_id):
-        """Helper to build standardized response."""
+    def _build_result(self, action, template):
+        """Helper to build standardized response from a _result_template."""
+        result = template.copy()
+        result["action_id"] = action["action_id"]
         # Extract direction if present in parameters
-        params = action.get("parameters", {})
-        direction = params.get("spatial_direction")
-        
-        return {
-            "action_id": action["action_id"],
-            "action_type_executed": executed_type,
-            "spatial_direction": direction,
-            "status": status,
-            "reason": reason,
-            "companion_id": action.get("assigned_to", DEFAULT_COMPANION_ID),
-            "response_id": response_id
-        }
+        result["spatial_direction"] = (action.get("parameters") or _EMPTY_PARAMS).get("spatial_direction")
+        result["companion_id"] = action["assigned_to"]
+        return result
 
     def reset(self):
         """Reset the UE state (for testing)."""
         logger.info("Resetting Mock Unreal Engine state")
-        for companion_id in self.companion_state:
-            self.companion_state[companion_id] = {
-                "is_following": False,
-                "is_waiting": False,
-                "is_defending": False,
-                "following_target": None,
-                "current_target": None
-            }
+        self.companion_state.clear()
+        self.companion_state[DEFAULT_COMPANION_ID] = CompanionState()
 
 
 # ============================================================================
 # Singleton instance
 # ============================================================================
 
-_ue_instance = None
+# Created at import time: module import is serialized by the import lock,
+# so every thread sees the same instance without a lazy check or extra lock.
+_ue_instance = MockUnrealEngine()
 
 def get_unreal_engine() -> MockUnrealEngine:
-    global _ue_instance
-    if _ue_instance is None:
-        _ue_instance = MockUnrealEngine()
     return _ue_instance
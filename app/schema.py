@@ -8,9 +8,15 @@ This module defines the authoritative JSON schemas for:
 It also provides validation functions to ensure schema compliance.
 """
 
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from typing import Dict, Any, List
-import json
+from . import _json
+
+try:
+    import fastjsonschema
+except ImportError:  # optional speedup, jsonschema is the fallback
+    fastjsonschema = None
 
 
 # ============================================================================
@@ -166,6 +172,97 @@ RESPONSE_SCHEMA = {
 # Validation Functions
 # ============================================================================
 
+def _compile_checker(schema: Dict[str, Any]):
+    """
+    Compile a schema once into a checker returning "" if valid, else the error message.
+    
+    Uses fastjsonschema's generated validator when installed, falling back
+    to a prebuilt jsonschema Draft7Validator.
+    """
+    if fastjsonschema is not None:
+        validate_fast = fastjsonschema.compile(schema)
+        
+        def check(instance: Any) -> str:
+            try:
+                validate_fast(instance)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return e.message
+            return ""
+        return check
+    
+    Draft7Validator.check_schema(schema)
+    validator = Draft7Validator(schema)
+    
+    def check(instance: Any) -> str:
+        error = best_match(validator.iter_errors(instance))
+        return "" if error is None else error.message
+    return check
+
+
+_check_command = _compile_checker(COMMAND_SCHEMA)
+_check_response = _compile_checker(RESPONSE_SCHEMA)
+
+
+# Closed vocabularies from COMMAND_SCHEMA, as frozensets for O(1) membership tests
+_ACTION_PROPERTIES = COMMAND_SCHEMA["properties"]["actions"]["items"]["properties"]
+ACTION_TYPES = frozenset(_ACTION_PROPERTIES["type"]["enum"])
+PRIORITIES = frozenset(_ACTION_PROPERTIES["priority"]["enum"])
+SPATIAL_DIRECTIONS = frozenset(_ACTION_PROPERTIES["parameters"]["properties"]["spatial_direction"]["enum"])
+
+
+def _is_valid_command_fast(command: Any) -> bool:
+    """
+    Hand-written check of every COMMAND_SCHEMA constraint.
+    
+    Accepts exactly what the schema accepts, so a True result is final.
+    A False result falls through to the compiled validator, which
+    produces the error message.
+    """
+    if not isinstance(command, dict):
+        return False
+    actions = command.get("actions")
+    if not (isinstance(command.get("command_id"), str)
+            and isinstance(command.get("dialogue_context"), str)
+            and isinstance(command.get("requires_clarification"), bool)
+            and isinstance(actions, list) and actions):
+        return False
+    
+    for action in actions:
+        if not isinstance(action, dict):
+            return False
+        action_type = action.get("type")
+        priority = action.get("priority")
+        if not (isinstance(action.get("action_id"), str)
+                and isinstance(action.get("assigned_to"), str)
+                and isinstance(action_type, str) and action_type in ACTION_TYPES
+                and isinstance(priority, str) and priority in PRIORITIES):
+            return False
+        if "depends_on" in action and not (action["depends_on"] is None or isinstance(action["depends_on"], str)):
+            return False
+        
+        if "target" in action:
+            target = action["target"]
+            if not isinstance(target, dict) or "category_hint" not in target:
+                return False
+            descriptors = target.get("descriptors")
+            hint = target["category_hint"]
+            if not (isinstance(descriptors, list) and all(isinstance(d, str) for d in descriptors)):
+                return False
+            if not (hint is None or isinstance(hint, str)):
+                return False
+        
+        if "parameters" in action:
+            params = action["parameters"]
+            if not isinstance(params, dict):
+                return False
+            if "spatial_direction" in params:
+                direction = params["spatial_direction"]
+                if not (isinstance(direction, str) and direction in SPATIAL_DIRECTIONS):
+                    return False
+    
+    return True
+
+
 def validate_command(command: Dict[str, Any]) -> tuple[bool, str]:
     """
     Validate a command against the COMMAND_SCHEMA.
@@ -179,10 +276,12 @@ def validate_command(command: Dict[str, Any]) -> tuple[bool, str]:
         - error_message: Empty string if valid, error description otherwise
     """
     try:
-        validate(instance=command, schema=COMMAND_SCHEMA)
+        if _is_valid_command_fast(command):
+            return True, ""
+        error = _check_command(command)
+        if error:
+            return False, f"Schema validation failed: {error}"
         return True, ""
-    except ValidationError as e:
-        return False, f"Schema validation failed: {e.message}"
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
@@ -200,10 +299,10 @@ def validate_response(response: Dict[str, Any]) -> tuple[bool, str]:
         - error_message: Empty string if valid, error description otherwise
     """
     try:
-        validate(instance=response, schema=RESPONSE_SCHEMA)
+        error = _check_response(response)
+        if error:
+            return False, f"Schema validation failed: {error}"
         return True, ""
-    except ValidationError as e:
-        return False, f"Schema validation failed: {e.message}"
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
@@ -212,10 +311,12 @@ def pretty_print_json(data: Dict[str, Any]) -> str:
     """
     Pretty print JSON data for logging.
     
+    Uses orjson when installed, falling back to the stdlib json module.
+    
     Args:
         data: Dictionary to format
         
     Returns:
         Formatted JSON string
     """
-    return json.dumps(data, indent=2)
+    return _json.dumps_pretty(data)
@@ -0,0 +1,96 @@
+"""
+Semantic Command Cache
+
+Maps player utterances that mean the same thing ("follow me",
+"come with me", "stick close") onto one previously compiled command.
+Inputs are embedded by the local Ollama embedding model (see
+IntentCompiler) and compared by cosine similarity against the
+embeddings of inputs that already compiled successfully.
+
+This module is responsible ONLY for:
+1. Storing (embedding, command) pairs
+2. Returning the command of the nearest stored embedding above a threshold
+
+It does NOT:
+- Call the LLM or the embedding model
+- Validate commands (only validated commands are ever added)
+"""
+
+import logging
+import math
+import operator
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Sequence
+
+from . import _json
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length so a dot product is its cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0.0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """
+    Thread-safe nearest-neighbour cache over unit-length embeddings.
+
+    A linear scan is used: with a few hundred stored utterances it costs
+    well under a millisecond, far below the embedding request itself.
+    The oldest entries are dropped once maxsize is reached.
+    """
+
+    def __init__(self, maxsize: int, threshold: float):
+        self.threshold = threshold
+        self._entries = deque(maxlen=maxsize)  # (unit vector, command JSON)
+        self._lock = threading.Lock()
+
+    def lookup(self, embedding: Sequence[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached command closest to an embedding.
+
+        Args:
+            embedding: Embedding of the player's input
+
+        Returns:
+            A fresh copy of the best command if its similarity reaches
+            the threshold, otherwise None
+        """
+        query = _normalize(embedding)
+        best_similarity = self.threshold
+        best = None
+        with self._lock:
+            entries = list(self._entries)
+        for vector, serialized in entries:
+            similarity = sum(map(operator.mul, query, vector))
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best = serialized
+        if best is None:
+            return None
+        logger.debug("Semantic cache hit (similarity %.3f)", best_similarity)
+        return _json.loads(best)
+
+    def add(self, embedding: Sequence[float], command: Dict[str, Any]) -> None:
+        """
+        Store a validated command under the embedding of its input.
+
+        Args:
+            embedding: Embedding of the player's input
+            command: Command that passed schema validation
+        """
+        if self._entries.maxlen == 0:
+            return
+        entry = (_normalize(embedding), _json.dumps(command))
+        with self._lock:
+            self._entries.append(entry)
+
+    def clear(self) -> None:
+        """Drop all cached commands."""
+        with self._lock:
+            self._entries.clear()
@@ -15,7 +15,7 @@ Usage:
 
 import sys
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.intent_compiler import compile_intent
 from app.mock_unreal import get_unreal_engine
 from app.dialogue_resolver import resolve_dialogue
@@ -26,6 +26,46 @@ from app.config import LOG_LEVEL, LOG_FORMAT
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Initialize UE instance
+ue = get_unreal_engine()
+
+
+def process_command(text_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Run the full pipeline without console output.
+    
+    Args:
+        text_input: Natural language command from player
+        
+    Returns:
+        Dictionary with the command, UE response, action_type, response_id
+        and dialogue, or None if the LLM could not generate valid JSON
+    """
+    return execute_compiled(compile_intent(text_input))
+
+
+def execute_compiled(command: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Run an already compiled command through UE and dialogue resolution.
+    
+    Args:
+        command: Command from compile_intent / compile_batch, or None if compilation failed
+        
+    Returns:
+        Same result dictionary as process_command, or None if command is None
+    """
+    if command is None:
+        return None
+    
+    response = ue.execute_command(command)
+    return {
+        "command": command,
+        "response": response,
+        "action_type": command["actions"][0]["type"],
+        "response_id": response["actions"][0]["response_id"],
+        "dialogue": resolve_dialogue(response)[0]
+    }
+
 
 def run_pipeline(text_input: str) -> bool:
     """
@@ -63,7 +103,6 @@ def run_pipeline(text_input: str) -> bool:
     # STAGE 3: Unreal Engine Execution
     # ========================================================================
     print("\n🎮 UNREAL ENGINE PROCESSING...")
-    ue = get_unreal_engine()
     
     try:
         response = ue.execute_command(command)
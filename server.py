@@ -3,24 +3,38 @@ Flask Web Server for AI Game Companion
 Converts the prototype into a production-ready REST API for Unreal Engine integration
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import logging
+import os
+import queue
 import time
-from app.intent_compiler import compile_intent
+from app.intent_compiler import compile_intent_with_source
 from app.mock_unreal import get_unreal_engine
 from app.dialogue_resolver import resolve_dialogue
 from app.schema import pretty_print_json
+from app._json import dumps as json_dumps
 
-# Configure logging
+# Configure logging: request threads only enqueue records, a listener thread
+# does the file and console writes
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler("server.log"),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("server.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush queued records on shutdown
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
@@ -30,6 +44,13 @@ CORS(app)  # Enable CORS for Unreal Engine requests
 # Initialize UE instance
 ue = get_unreal_engine()
 
+
+def _json_response(payload):
+    """
+    Serialize a response body with app._json (orjson when installed) instead of jsonify.
+    """
+    return Response(json_dumps(payload), mimetype='application/json')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
@@ -83,12 +104,12 @@ def process_command():
         companion_id = data.get('companion_id', 'companion_01')
         player_id = data.get('player_id', 'player_01')
         
-        logger.info(f"Processing command: '{text_input}' for companion: {companion_id}")
+        logger.info("Processing command: '%s' for companion: %s", text_input, companion_id)
         
         # Step 1: Compile intent with LLM
         logger.info("Step 1: Compiling intent with Ollama...")
         compile_start = time.time()
-        command = compile_intent(text_input)
+        command, source = compile_intent_with_source(text_input)
         compile_time = (time.time() - compile_start) * 1000
         
         if not command:
@@ -99,38 +120,41 @@ def process_command():
                 'processing_time_ms': int((time.time() - start_time) * 1000)
             }), 400
         
-        logger.info(f"Intent compiled in {compile_time:.0f}ms")
-        logger.debug(f"Command JSON:\n{pretty_print_json(command)}")
+        logger.info("Intent compiled in %.0fms", compile_time)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Command JSON:\n%s", pretty_print_json(command))
         
         # Step 2: Execute in Unreal Engine
         logger.info("Step 2: Executing command in UE...")
         ue_start = time.time()
         response = ue.execute_command(command)
         ue_time = (time.time() - ue_start) * 1000
-        logger.info(f"UE execution completed in {ue_time:.0f}ms")
+        logger.info("UE execution completed in %.0fms", ue_time)
         
         # Step 3: Resolve dialogue
         logger.info("Step 3: Resolving dialogue...")
         dialogue_start = time.time()
         dialogues = resolve_dialogue(response)
         dialogue_time = (time.time() - dialogue_start) * 1000
-        logger.info(f"Dialogue resolved in {dialogue_time:.0f}ms")
+        logger.info("Dialogue resolved in %.0fms", dialogue_time)
         
         # Calculate total time
         total_time = (time.time() - start_time) * 1000
         
         # Build strict response
         action_result = response['actions'][0]
+        status = action_result['status']
         result = {
-            'success': action_result['status'],
+            'success': status,
             'dialogue': dialogues[0],
             'response_id': action_result['response_id'],
             'command_id': response['command_id'],
             'action_type_executed': action_result['action_type_executed'],
             'spatial_direction': action_result.get('spatial_direction'),
-            'action_status': action_result['status'],
+            'action_status': status,
             'action_reason': action_result.get('reason'),
             'processing_time_ms': int(total_time),
+            'source': source,  # step that produced the command (cache, fast_path, semantic_cache, llm)
             'timing_breakdown': {
                 'llm_ms': int(compile_time),
                 'ue_ms': int(ue_time),
@@ -139,30 +163,37 @@ def process_command():
         }
         
         # 5️⃣ Add Structured Logging (Farcana Requirement)
-        log_msg = f"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("""
         \n==================================================
         UE EXECUTION REPORT
         ==================================================
-        INPUT: "{text_input}"
+        INPUT: "%s"
         --------------------------------------------------
         LLM OUTPUT:
-        {command['actions'][0]['type']} (Target: {command['actions'][0].get('target', {}).get('category_hint')})
+        %s (Target: %s)
         --------------------------------------------------
         UE EXECUTION:
-        Action Type: {action_result['action_type_executed']}
-        Status: {action_result['status']}
-        Reason: {action_result['reason']}
-        Response ID: {action_result['response_id']}
+        Action Type: %s
+        Status: %s
+        Reason: %s
+        Response ID: %s
         --------------------------------------------------
         DIALOGUE:
-        "{dialogues[0]}"
-        ==================================================\n"""
-        logger.info(log_msg)
+        "%s"
+        ==================================================\n""",
+                text_input,
+                command['actions'][0]['type'], command['actions'][0].get('target', {}).get('category_hint'),
+                action_result['action_type_executed'],
+                status,
+                action_result['reason'],
+                action_result['response_id'],
+                dialogues[0])
         
-        return jsonify(result)
+        return _json_response(result)
         
     except Exception as e:
-        logger.error(f"Error processing command: {str(e)}", exc_info=True)
+        logger.error("Error processing command: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': f'Internal server error: {str(e)}',
@@ -182,7 +213,7 @@ def reset_state():
             'message': 'State reset successfully'
         })
     except Exception as e:
-        logger.error(f"Error resetting state: {str(e)}")
+        logger.error("Error resetting state: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -213,10 +244,10 @@ if __name__ == '__main__':
     logger.info("  POST /api/reset       - Reset UE state")
     logger.info("="*80)
     
-    # Run server
+    # Run server (set FLASK_DEBUG=1 for the reloader and debugger while developing)
     app.run(
         host='0.0.0.0',
         port=5000,
-        debug=True,
+        debug=os.environ.get('FLASK_DEBUG', '0') == '1',
         threaded=True
     )
@@ -1,12 +1,12 @@
-from openai import OpenAI
+from app.config import OLLAMA_MODEL
+from app.intent_compiler import get_ollama_client
 
-client = OpenAI(
-    api_key="ollama",
-    base_url="http://localhost:11434/v1"
-)
+# Fail fast instead of hanging on a stuck server (shares the app's connection pool)
+client = get_ollama_client().with_options(timeout=20, max_retries=3)
 
 response = client.chat.completions.create(
-    model="llama3:latest",
+    model=OLLAMA_MODEL,
+    max_tokens=8,
     messages=[
         {"role": "user", "content": "Hello, simply say 'OK'."}
     ]
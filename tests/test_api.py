@@ -14,6 +14,9 @@ import sys
 
 SERVER_URL = "http://localhost:5000"
 
+# One keep-alive connection for the whole run instead of a new one per request
+session = requests.Session()
+
 def test_health():
     """Test health check endpoint"""
     print("\n" + "="*60)
@@ -21,7 +24,7 @@ def test_health():
     print("="*60)
     
     try:
-        response = requests.get(f"{SERVER_URL}/health", timeout=5)
+        response = session.get(f"{SERVER_URL}/health", timeout=5)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         
@@ -41,7 +44,7 @@ def test_command(text_command, expected_dialogue=None):
     
     try:
         start = time.time()
-        response = requests.post(
+        response = session.post(
             f"{SERVER_URL}/api/command",
             json={"text": text_command, "companion_id": "companion_01"},
             timeout=60
@@ -82,7 +85,7 @@ def test_reset():
     print("-"*60)
     
     try:
-        response = requests.post(f"{SERVER_URL}/api/reset", timeout=5)
+        response = session.post(f"{SERVER_URL}/api/reset", timeout=5)
         print(f"Status: {response.status_code}")
         
         assert response.status_code == 200
@@ -103,7 +106,7 @@ def main():
     
     # Check server is running
     try:
-        requests.get(f"{SERVER_URL}/health", timeout=3)
+        session.get(f"{SERVER_URL}/health", timeout=3)
     except requests.exceptions.ConnectionError:
         print("❌ Server not running! Start it with: python server.py")
         return 1
@@ -125,6 +128,7 @@ def main():
         ("Unknown",           lambda: test_command("do a barrel roll", "I didn't understand that command.")),
     ]
     
+    # Tests run in order: "Stop Follow" relies on the state left by "Follow"
     for name, test_func in tests:
         try:
             if test_func():
@@ -134,7 +138,6 @@ def main():
         except Exception as e:
             print(f"❌ EXCEPTION: {e}")
             failed += 1
-        time.sleep(1)
     
     print("\n" + "="*60)
     print(f"RESULTS: {passed}/{len(tests)} passed, {failed} failed")
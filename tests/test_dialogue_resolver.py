@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to find 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import dialogue_resolver
+from app.config import DIALOGUE_MAP
+
+
+class TestDialogueResolver(unittest.TestCase):
+
+    def test_resolves_one_line_per_action(self):
+        """Each action result maps to its DIALOGUE_MAP entry, in order"""
+        response = {
+            "signal_type": "validation",
+            "command_id": "cmd_dialogue_01",
+            "actions": [
+                {"response_id": "RESP_FOLLOW_ACCEPT"},
+                {"response_id": "RESP_NO_TARGET"},
+                {"response_id": "RESP_FOLLOW_ACCEPT"}
+            ]
+        }
+
+        dialogues = dialogue_resolver.resolve_dialogue(response)
+
+        self.assertEqual(dialogues, [
+            DIALOGUE_MAP["RESP_FOLLOW_ACCEPT"],
+            DIALOGUE_MAP["RESP_NO_TARGET"],
+            DIALOGUE_MAP["RESP_FOLLOW_ACCEPT"]
+        ])
+
+    def test_unknown_response_id(self):
+        """Unknown ids fall back to a placeholder and are warned about every time"""
+        response = {"actions": [{"response_id": "RESP_DOES_NOT_EXIST"}]}
+
+        for _ in range(2):
+            with self.assertLogs(dialogue_resolver.logger, "WARNING"):
+                dialogues = dialogue_resolver.resolve_dialogue(response)
+            self.assertEqual(dialogues, ["[Unknown response: RESP_DOES_NOT_EXIST]"])
+
+    def test_resolver_is_singleton(self):
+        """resolve_dialogue reuses one resolver instance"""
+        self.assertIs(dialogue_resolver.get_dialogue_resolver(),
+                      dialogue_resolver.get_dialogue_resolver())
+
+
+if __name__ == '__main__':
+    unittest.main()
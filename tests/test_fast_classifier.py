@@ -0,0 +1,60 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to find 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_intent_prompt
+from app.dialogue_resolver import resolve_dialogue
+from app.fast_classifier import fast_match
+from app.mock_unreal import get_unreal_engine
+from app.schema import validate_command
+
+KNOWN_PHRASES = [
+    ("follow me", "follow"),
+    ("Come with me!", "follow"),
+    ("wait here", "hold_position"),
+    ("hold your position.", "hold_position"),
+    ("attack that enemy", "engage"),
+]
+
+
+class TestFastClassifier(unittest.TestCase):
+
+    def test_known_phrases(self):
+        """Canonical phrases resolve to their action type with a valid command"""
+        for text, expected_type in KNOWN_PHRASES:
+            with self.subTest(text=text):
+                command = fast_match(text)
+                self.assertIsNotNone(command)
+                self.assertEqual(command["actions"][0]["type"], expected_type)
+                self.assertEqual(command["dialogue_context"], text)
+                self.assertEqual(validate_command(command), (True, ""))
+
+    def test_phrases_use_prompt_vocabulary(self):
+        """Fast-path actions are ones the LLM could emit and all have dialogue"""
+        prompt = get_intent_prompt()
+        ue = get_unreal_engine()
+        for text, expected_type in KNOWN_PHRASES:
+            with self.subTest(text=text):
+                self.assertIn(f"- {expected_type} ", prompt)
+                ue.reset()
+                dialogue = resolve_dialogue(ue.execute_command(fast_match(text)))
+                self.assertNotIn("[Unknown response", dialogue[0])
+
+    def test_unmatched_phrases_fall_through(self):
+        """Anything beyond a whole known phrase is left to the LLM"""
+        for text in ["don't follow me", "follow me to the left", "do a backflip", "stop following",
+                     "attack", "wait here and then follow me", ""]:
+            with self.subTest(text=text):
+                self.assertIsNone(fast_match(text))
+
+    def test_command_ids_are_unique(self):
+        """Each synthesized command gets its own command_id"""
+        self.assertNotEqual(fast_match("follow me")["command_id"],
+                            fast_match("follow me")["command_id"])
+
+
+if __name__ == '__main__':
+    unittest.main()
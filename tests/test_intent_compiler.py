@@ -0,0 +1,301 @@
+import unittest
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+
+# Add parent directory to path to find 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import config, intent_compiler
+from app.config import LLM_MAX_RETRIES
+from app.semantic_cache import SemanticCache
+from app.intent_compiler import (
+    SOURCE_CACHE, SOURCE_FAST_PATH, SOURCE_LLM,
+    CommandCache, IntentCompiler, get_intent_compiler
+)
+
+COMMAND = {
+    "command_id": "cmd_cache_01",
+    "actions": [{
+        "action_id": "act_01",
+        "type": "follow",
+        "target": {"descriptors": ["player"], "category_hint": "player"},
+        "parameters": {"spatial_direction": "Forward"},
+        "priority": "normal",
+        "depends_on": None
+    }],
+    "dialogue_context": "follow me",
+    "requires_clarification": False
+}
+
+
+class TestCommandCache(unittest.TestCase):
+
+    def test_hit_on_normalized_input(self):
+        """Case and whitespace variations share one cache entry"""
+        cache = CommandCache(maxsize=8)
+        cache.put("Follow me", COMMAND)
+
+        self.assertEqual(cache.get("  follow   ME "), COMMAND)
+        self.assertIsNone(cache.get("follow him"))
+
+    def test_hits_are_independent_copies(self):
+        """Mutating a returned command does not corrupt the cache"""
+        cache = CommandCache(maxsize=8)
+        cache.put("follow me", COMMAND)
+
+        cache.get("follow me")["actions"][0]["assigned_to"] = "companion_02"
+
+        self.assertNotIn("assigned_to", cache.get("follow me")["actions"][0])
+
+    def test_evicts_least_recently_used(self):
+        """The oldest untouched entry is dropped once maxsize is exceeded"""
+        cache = CommandCache(maxsize=2)
+        cache.put("a", COMMAND)
+        cache.put("b", COMMAND)
+        cache.get("a")
+        cache.put("c", COMMAND)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_zero_size_disables_cache(self):
+        """maxsize=0 never stores anything"""
+        cache = CommandCache(maxsize=0)
+        cache.put("follow me", COMMAND)
+
+        self.assertIsNone(cache.get("follow me"))
+
+
+class TestParseJson(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.compiler = IntentCompiler()
+
+    def test_raw_and_fenced_output(self):
+        """JSON is recovered from bare output and from markdown code fences"""
+        outputs = [
+            '{"a": "`x`"}',
+            '```json\n{"a": "`x`"}\n```',
+            'Here you go:\n```\n{"a": "`x`"}\n```\nDone.',
+        ]
+        for raw in outputs:
+            with self.subTest(raw=raw):
+                self.assertEqual(self.compiler._parse_json(raw), {"a": "`x`"})
+
+    def test_invalid_output(self):
+        """Unparseable output, including an unclosed fence, returns None"""
+        for raw in ["not json", '```json\n{"a": 1}', "```json\n```"]:
+            with self.subTest(raw=raw):
+                self.assertIsNone(self.compiler._parse_json(raw))
+
+
+def _llm_reply(content, chunk_size=7):
+    """Fake streaming chat completion delivering `content` in small chunks."""
+    chunks = []
+    for start in range(0, len(content), chunk_size):
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = content[start:start + chunk_size]
+        chunks.append(chunk)
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(chunks)
+    return stream
+
+
+class TestCompileBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.compiler = IntentCompiler()
+        self.compiler.client = MagicMock()
+
+    def _command(self, action_type, text):
+        command = copy.deepcopy(COMMAND)
+        command["actions"][0]["type"] = action_type
+        command["actions"][0]["parameters"] = {}
+        command["actions"][0]["assigned_to"] = "companion_01"
+        command["dialogue_context"] = text
+        return command
+
+    def test_one_call_for_uncached_inputs(self):
+        """Inputs the fast path cannot resolve share a single LLM call"""
+        texts = ["batch: suppress the window", "follow me", "batch: clear this room"]
+        commands = [self._command("suppress", texts[0]), self._command("clear_area", texts[2])]
+        self.compiler.client.chat.completions.create.return_value = _llm_reply(
+            json.dumps({"commands": commands}))
+
+        results = self.compiler.compile_batch(texts)
+
+        self.compiler.client.chat.completions.create.assert_called_once()
+        self.assertEqual([r["actions"][0]["type"] for r in results],
+                         ["suppress", "follow", "clear_area"])
+
+    def test_malformed_batch_falls_back_per_input(self):
+        """A reply with the wrong number of commands retries each input alone"""
+        texts = ["batch: throw a grenade", "batch: pick up the ammo"]
+        self.compiler.client.chat.completions.create.side_effect = [
+            _llm_reply(json.dumps({"commands": []})),
+            _llm_reply(json.dumps(self._command("throw_equipment", texts[0]))),
+            _llm_reply(json.dumps(self._command("pick_up", texts[1]))),
+        ]
+
+        results = self.compiler.compile_batch(texts)
+
+        self.assertEqual([r["actions"][0]["type"] for r in results],
+                         ["throw_equipment", "pick_up"])
+
+    def test_semantic_cache_resolves_before_batching(self):
+        """Inputs the semantic cache answers never reach the LLM"""
+        self.compiler.semantic_cache = SemanticCache(maxsize=8, threshold=0.9)
+        self.compiler.semantic_cache.add([1.0, 0.0], self._command("suppress", "suppress them"))
+        self.compiler.client.embeddings.create.return_value.data[0].embedding = [1.0, 0.01]
+
+        results = self.compiler.compile_batch(["batch: keep them pinned", "follow me"])
+
+        self.compiler.client.chat.completions.create.assert_not_called()
+        self.assertEqual([r["actions"][0]["type"] for r in results], ["suppress", "follow"])
+
+    def test_system_prompt_describes_batch_reply(self):
+        """Batch calls rely on the shared system prompt to ask for a list"""
+        self.assertIn('{"commands": [...]}', self.compiler.system_prompt)
+
+
+class TestCompileSource(unittest.TestCase):
+
+    def test_reports_source(self):
+        """compile_with_source names the step that produced the command"""
+        compiler = IntentCompiler()
+        compiler.client = MagicMock()
+        command = copy.deepcopy(COMMAND)
+        command["actions"][0]["parameters"] = {}
+        command["actions"][0]["assigned_to"] = "companion_01"
+        compiler.client.chat.completions.create.return_value = _llm_reply(json.dumps(command))
+
+        self.assertEqual(compiler.compile_with_source("follow me")[1], SOURCE_FAST_PATH)
+        self.assertEqual(compiler.compile_with_source("source: go with them"), (command, SOURCE_LLM))
+        self.assertEqual(compiler.compile_with_source("source: go with them"), (command, SOURCE_CACHE))
+        compiler.client.chat.completions.create.assert_called_once()
+
+
+def _async_llm_reply(content, chunk_size=7):
+    """Async counterpart of _llm_reply."""
+    stream = MagicMock()
+    stream.__aiter__.return_value = list(_llm_reply(content, chunk_size))
+    stream.close = AsyncMock()
+    return stream
+
+
+class TestAsyncCompile(unittest.TestCase):
+
+    def setUp(self):
+        self.compiler = IntentCompiler()
+        self.client = MagicMock()
+        self.client.chat.completions.create = AsyncMock()
+        patcher = patch.object(intent_compiler, "get_async_ollama_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_compile_many_concurrently(self):
+        """Inputs go through the same cache, fast path and LLM steps as compile()"""
+        texts = ["async: suppress the window", "follow me"]
+        command = copy.deepcopy(COMMAND)
+        command["actions"][0]["type"] = "suppress"
+        command["actions"][0]["parameters"] = {}
+        command["actions"][0]["assigned_to"] = "companion_01"
+        command["dialogue_context"] = texts[0]
+        self.client.chat.completions.create.side_effect = [_async_llm_reply(json.dumps(command))]
+
+        results = asyncio.run(self.compiler.acompile_many(texts))
+        cached = asyncio.run(self.compiler.acompile_with_source(texts[0]))
+
+        self.client.chat.completions.create.assert_awaited_once()
+        self.assertEqual([r["actions"][0]["type"] for r in results], ["suppress", "follow"])
+        self.assertEqual(cached, (command, SOURCE_CACHE))
+
+    def test_retries_like_compile(self):
+        """Invalid replies are retried and exhausted attempts report a failure"""
+        self.client.chat.completions.create.side_effect = lambda **kwargs: _async_llm_reply("not json")
+
+        self.assertEqual(asyncio.run(self.compiler.acompile_with_source("async: dance")), (None, SOURCE_LLM))
+        self.assertEqual(self.client.chat.completions.create.await_count, LLM_MAX_RETRIES)
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.compiler = IntentCompiler()
+
+    def test_stops_at_closing_brace(self):
+        """Reading ends with the top-level object, ignoring braces in strings"""
+        stream = _llm_reply('{"a": {"b": "}{\\"}"}}\n\n   trailing text {')
+
+        self.assertEqual(self.compiler._read_stream(stream), '{"a": {"b": "}{\\"}"}}')
+        stream.close.assert_called_once()
+
+    def test_fenced_reply(self):
+        """A fenced reply still parses although reading stops before its closing fence"""
+        replies = [
+            '```json\n{"a": "`x`"}\n```',
+            'Here you go:\n```\n{"a": "`x`"}\n```\nDone.',
+        ]
+        for reply in replies:
+            with self.subTest(reply=reply):
+                raw_output = self.compiler._read_stream(_llm_reply(reply, chunk_size=3))
+                self.assertEqual(self.compiler._parse_json(raw_output.strip()), {"a": "`x`"})
+
+    def test_incomplete_object_returns_everything(self):
+        """A reply cut off mid-object is returned as-is for parsing to reject"""
+        self.assertEqual(self.compiler._read_stream(_llm_reply('{"a": [1, 2')), '{"a": [1, 2')
+
+
+class TestSettings(unittest.TestCase):
+
+    def tearDown(self):
+        config.get_settings.cache_clear()
+
+    def test_env_file_values_apply(self):
+        """Knobs set while loading .env reach the compiler"""
+        def load_env():
+            os.environ["INTENT_CACHE_SIZE"] = "7"
+            os.environ["FAST_PATH_ENABLED"] = "0"
+
+        config.get_settings.cache_clear()
+        with patch.dict(os.environ), patch.object(config, "load_env", side_effect=load_env):
+            compiler = IntentCompiler()
+
+        self.assertEqual(compiler.command_cache.maxsize, 7)
+        self.assertFalse(compiler.fast_path_enabled)
+
+    def test_malformed_numbers_use_defaults(self):
+        """A malformed numeric setting is warned about and replaced by its default"""
+        config.get_settings.cache_clear()
+        with patch.dict(os.environ, {"SEMANTIC_CACHE_THRESHOLD": "abc", "INTENT_CACHE_SIZE": "lots"}):
+            with self.assertLogs(config.logger, "WARNING"):
+                settings = config.get_settings()
+
+        self.assertEqual(settings.semantic_cache_threshold, 0.88)
+        self.assertEqual(settings.intent_cache_size, 4096)
+
+
+class TestIntentCompilerSingleton(unittest.TestCase):
+
+    def test_compiler_is_singleton(self):
+        """compile_intent reuses one compiler and its HTTP client"""
+        self.assertIs(get_intent_compiler(), get_intent_compiler())
+
+    def test_concurrent_first_use_builds_one_compiler(self):
+        """Threads racing on first use all get the same compiler"""
+        with patch.object(intent_compiler, "_compiler_instance", None):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                compilers = list(pool.map(lambda _: get_intent_compiler(), range(8)))
+
+        self.assertEqual(len({id(compiler) for compiler in compilers}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,22 +3,31 @@ Comprehensive test script for multi-command support
 Tests all 7 action types with required test cases
 """
 
-import subprocess
 import sys
-import time
+import os
 
-# Test cases as specified in requirements
+# Add parent directory to path to find 'run' and 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Send every case through the model, not the fast_classifier regexes
+# (FAST_PATH_ENABLED=1 in the environment opts back in)
+os.environ.setdefault("FAST_PATH_ENABLED", "0")
+
+from run import execute_compiled, ue
+from app.intent_compiler import get_intent_compiler
+
+# Test cases as specified in requirements, expected in the prompt's vocabulary
 TEST_CASES = [
     ("follow me", "follow", "RESP_FOLLOW_ACCEPT"),
-    ("stop following", "stop_follow", "RESP_STOP_ACCEPT"),
-    ("wait here", "wait", "RESP_WAIT_ACCEPT"),
-    ("attack that enemy", "attack", "RESP_ATTACK_ACCEPT"),
-    ("defend this area", "defend", "RESP_DEFEND_ACCEPT"),
-    ("help me", "assist", "RESP_ASSIST_ACCEPT"),
+    ("stop following", "cancel", "RESP_CANCEL_ACCEPT"),
+    ("wait here", "hold_position", "RESP_HOLD_ACCEPT"),
+    ("attack that enemy", "engage", "RESP_ENGAGE_ACCEPT"),
+    ("defend this area", "hold_position", "RESP_HOLD_ACCEPT"),
+    ("help me", "regroup", "RESP_REGROUP_ACCEPT"),
     ("do a backflip", "unknown", "RESP_UNKNOWN_COMMAND"),
 ]
 
-def run_test(text_input, expected_type, expected_response_id):
+def run_test(text_input, expected_type, expected_response_id, command):
     """Run a single test case"""
     print(f"\n{'='*80}")
     print(f"TEST: \"{text_input}\"")
@@ -26,58 +35,59 @@ def run_test(text_input, expected_type, expected_response_id):
     print(f"Expected Response: {expected_response_id}")
     print('='*80)
     
-    result = subprocess.run(
-        [sys.executable, "run.py", text_input],
-        capture_output=True,
-        text=True
-    )
+    # Each case starts from a fresh companion, as a separate run.py process would
+    ue.reset()
+    try:
+        result = execute_compiled(command)
+    except Exception as e:
+        print(f"❌ FAILED: {e}")
+        return False
     
-    output = result.stdout + result.stderr
+    if result is None:
+        print("❌ FAILED: LLM could not generate valid JSON")
+        return False
     
-    # Check for success
-    if result.returncode == 0:
-        # Extract dialogue from output
-        if "🗣️  DIALOGUE:" in output:
-            dialogue_line = [line for line in output.split('\n') if "🗣️  DIALOGUE:" in line][0]
-            dialogue = dialogue_line.split("🗣️  DIALOGUE:")[1].strip()
-            print(f"✅ SUCCESS")
-            print(f"Dialogue: \"{dialogue}\"")
-            
-            # Verify action type in JSON
-            if f'"type": "{expected_type}"' in output:
-                print(f"✅ Action type correct: {expected_type}")
-            else:
-                print(f"⚠️  Action type mismatch (expected: {expected_type})")
-            
-            return True
-        else:
-            print(f"⚠️  No dialogue found in output")
-            return False
+    print(f"✅ SUCCESS")
+    print(f"Dialogue: \"{result['dialogue']}\"")
+    
+    # Verify action type in JSON and the response UE returned
+    passed = True
+    if result["action_type"] == expected_type:
+        print(f"✅ Action type correct: {expected_type}")
     else:
-        print(f"❌ FAILED (exit code: {result.returncode})")
-        if "quota" in output.lower():
-            print("⚠️  API quota exceeded - waiting 60 seconds...")
-            time.sleep(60)
-        return False
+        print(f"❌ Action type mismatch (expected: {expected_type}, got: {result['action_type']})")
+        passed = False
+    if result["response_id"] == expected_response_id:
+        print(f"✅ Response correct: {expected_response_id}")
+    else:
+        print(f"❌ Response mismatch (expected: {expected_response_id}, got: {result['response_id']})")
+        passed = False
+    # Nonsense input must be flagged, not silently mapped to some action
+    if expected_type == "unknown" and not result["command"]["requires_clarification"]:
+        print("❌ requires_clarification not set for an unknown command")
+        passed = False
+    
+    return passed
 
 def main():
     print("\n" + "="*80)
     print("MULTI-COMMAND SUPPORT - COMPREHENSIVE TESTS")
     print("="*80)
     print(f"\nTesting {len(TEST_CASES)} command types...")
+    print(f"Fast path: {'on' if get_intent_compiler().fast_path_enabled else 'off'}")
     
     passed = 0
     failed = 0
     
-    for text_input, expected_type, expected_response_id in TEST_CASES:
-        success = run_test(text_input, expected_type, expected_response_id)
+    # Compile every input up front: whatever the cache and fast path miss shares one LLM call
+    commands = get_intent_compiler().compile_batch([case[0] for case in TEST_CASES])
+    
+    for (text_input, expected_type, expected_response_id), command in zip(TEST_CASES, commands):
+        success = run_test(text_input, expected_type, expected_response_id, command)
         if success:
             passed += 1
         else:
             failed += 1
-        
-        # Small delay between tests to avoid rate limiting
-        time.sleep(2)
     
     print("\n" + "="*80)
     print("TEST SUMMARY")
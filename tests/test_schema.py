@@ -0,0 +1,98 @@
+import unittest
+import copy
+import sys
+import os
+
+# Add parent directory to path to find 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import schema
+
+VALID_COMMAND = {
+    "command_id": "cmd_schema_01",
+    "actions": [{
+        "action_id": "act_01",
+        "type": "move_to",
+        "target": {"descriptors": ["left"], "category_hint": "location"},
+        "parameters": {"spatial_direction": "Left"},
+        "assigned_to": "companion_01",
+        "priority": "normal",
+        "depends_on": None
+    }],
+    "dialogue_context": "move left",
+    "requires_clarification": False
+}
+
+
+def _variant(path, value):
+    """Copy VALID_COMMAND with the value at `path` replaced (or deleted if value is ...)."""
+    command = copy.deepcopy(VALID_COMMAND)
+    node = command
+    for key in path[:-1]:
+        node = node[key]
+    if value is ...:
+        del node[path[-1]]
+    else:
+        node[path[-1]] = value
+    return command
+
+
+# (path, replacement) pairs covering each constraint in COMMAND_SCHEMA
+VARIANTS = [
+    (("command_id",), ...),
+    (("command_id",), 1),
+    (("dialogue_context",), None),
+    (("requires_clarification",), "no"),
+    (("requires_clarification",), ...),
+    (("actions",), []),
+    (("actions",), {}),
+    (("actions", 0), "act"),
+    (("actions", 0, "type"), "do_a_barrel_roll"),
+    (("actions", 0, "type"), ["follow"]),
+    (("actions", 0, "type"), "attack"),
+    (("actions", 0, "priority"), "urgent"),
+    (("actions", 0, "priority"), ...),
+    (("actions", 0, "assigned_to"), None),
+    (("actions", 0, "action_id"), 7),
+    (("actions", 0, "depends_on"), "act_00"),
+    (("actions", 0, "depends_on"), 3),
+    (("actions", 0, "depends_on"), ...),
+    (("actions", 0, "target"), {}),
+    (("actions", 0, "target"), ...),
+    (("actions", 0, "target", "descriptors"), [1]),
+    (("actions", 0, "target", "descriptors"), []),
+    (("actions", 0, "target", "category_hint"), None),
+    (("actions", 0, "target", "category_hint"), ...),
+    (("actions", 0, "target", "category_hint"), 5),
+    (("actions", 0, "parameters"), {}),
+    (("actions", 0, "parameters"), []),
+    (("actions", 0, "parameters", "spatial_direction"), "Up"),
+    (("actions", 0, "parameters", "spatial_direction"), None),
+    (("actions", 0, "parameters", "fire_mode"), "auto"),
+]
+
+
+class TestCommandSchema(unittest.TestCase):
+
+    def test_valid_command(self):
+        """A well-formed command passes validation"""
+        self.assertEqual(schema.validate_command(VALID_COMMAND), (True, ""))
+
+    def test_invalid_command_reports_error(self):
+        """Invalid commands fail with a schema error message"""
+        is_valid, error = schema.validate_command(_variant(("actions", 0, "type"), "fly"))
+        self.assertFalse(is_valid)
+        self.assertTrue(error.startswith("Schema validation failed:"))
+
+    def test_fast_check_matches_schema(self):
+        """The hand-written fast check agrees with the full schema validator"""
+        for path, value in VARIANTS:
+            command = _variant(path, value)
+            with self.subTest(path=path, value=value):
+                expected = schema._check_command(command) == ""
+                self.assertEqual(schema._is_valid_command_fast(command), expected)
+                self.assertEqual(schema.validate_command(command)[0], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to find 'app'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.semantic_cache import SemanticCache
+
+FOLLOW = {"command_id": "cmd_follow", "actions": []}
+ATTACK = {"command_id": "cmd_attack", "actions": []}
+
+
+class TestSemanticCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SemanticCache(maxsize=8, threshold=0.88)
+        self.cache.add([1.0, 0.0, 0.0], FOLLOW)
+        self.cache.add([0.0, 2.0, 0.0], ATTACK)
+
+    def test_returns_nearest_above_threshold(self):
+        """Similar embeddings resolve to the closest cached command"""
+        self.assertEqual(self.cache.lookup([0.95, 0.1, 0.0]), FOLLOW)
+        self.assertEqual(self.cache.lookup([0.0, 5.0, 0.5]), ATTACK)
+
+    def test_miss_below_threshold(self):
+        """Embeddings between both entries match neither"""
+        self.assertIsNone(self.cache.lookup([1.0, 1.0, 0.0]))
+        self.assertIsNone(self.cache.lookup([0.0, 0.0, 1.0]))
+
+    def test_hits_are_independent_copies(self):
+        """Mutating a returned command does not corrupt the cache"""
+        self.cache.lookup([1.0, 0.0, 0.0])["actions"].append("x")
+        self.assertEqual(self.cache.lookup([1.0, 0.0, 0.0]), FOLLOW)
+
+    def test_oldest_entry_evicted(self):
+        """Adding past maxsize drops the oldest utterance"""
+        cache = SemanticCache(maxsize=1, threshold=0.88)
+        cache.add([1.0, 0.0], FOLLOW)
+        cache.add([0.0, 1.0], ATTACK)
+        self.assertIsNone(cache.lookup([1.0, 0.0]))
+        self.assertEqual(cache.lookup([0.0, 1.0]), ATTACK)
+
+
+if __name__ == '__main__':
+    unittest.main()